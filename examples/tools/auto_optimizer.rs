@@ -1,9 +1,15 @@
 //! Auto-Optimizer - Find best configs from test results
 
 use serde::Deserialize;
-use std::fs;
+use std::fs::{self, File};
+use std::io::{self, BufWriter, Write};
 use glob::glob;
 use colored::*;
+use futures::stream::{self, StreamExt};
+
+/// Upper bound on result-file reads in flight (each one is a tokio
+/// blocking-pool task holding its file's bytes)
+const MAX_CONCURRENT_READS: usize = 16;
 
 #[derive(Debug, Deserialize, Clone)]
 struct TestResult {
@@ -18,7 +24,7 @@ struct TestResult {
 }
 
 #[tokio::main]
-async fn main() {
+async fn main() -> io::Result<()> {
     println!("\n{}\n", "=== AUTO-OPTIMIZER V2.5 - PROJECT FLASH ===".bright_green().bold());
     
     println!("Scanning for test results...\n");
@@ -27,27 +33,41 @@ async fn main() {
     let mut results = vec![];
     let mut file_count = 0;
     
-    for entry in glob("results/giga_v*_test_*.json").expect("Failed to read glob pattern") {
-        if let Ok(path) = entry {
-            match fs::read_to_string(&path) {
-                Ok(content) => {
-                    match serde_json::from_str::<Vec<TestResult>>(&content) {
-                        Ok(data) => {
-                            file_count += 1;
-                            results.extend(data);
-                        }
-                        Err(e) => println!("Skipping invalid file: {:?} ({})", path, e),
+    let paths: Vec<_> = glob("results/giga_v*_test_*.json")
+        .expect("Failed to read glob pattern")
+        .flatten()
+        .collect();
+    
+    // Keep up to MAX_CONCURRENT_READS reads in flight so file I/O overlaps
+    // instead of running back-to-back. `buffered` yields in glob order, so
+    // each file is parsed as it arrives and the messages below still print
+    // sequentially.
+    let mut reads = stream::iter(paths.iter().map(|path| async move {
+        (path, tokio::fs::read(path).await)
+    }))
+    .buffered(MAX_CONCURRENT_READS);
+    
+    while let Some((path, read)) = reads.next().await {
+        // Parse straight from the raw bytes - skips the separate UTF-8
+        // validation + String allocation that read_to_string would do
+        match read {
+            Ok(content) => {
+                match serde_json::from_slice::<Vec<TestResult>>(&content) {
+                    Ok(data) => {
+                        file_count += 1;
+                        results.extend(data);
                     }
+                    Err(e) => println!("Skipping invalid file: {:?} ({})", path, e),
                 }
-                Err(e) => println!("Failed to read {:?}: {}", path, e),
             }
+            Err(e) => println!("Failed to read {:?}: {}", path, e),
         }
     }
     
     if results.is_empty() {
         println!("{}", "No results found! Run tests first.".bright_red());
         println!("Try: cargo run --example giga_test --release\n");
-        return;
+        return Ok(());
     }
     
     println!("Loaded {} results from {} files\n", 
@@ -55,59 +75,86 @@ async fn main() {
         file_count.to_string().bright_yellow()
     );
     
-    // Sort by ROI
-    results.sort_by(|a, b| b.final_roi.partial_cmp(&a.final_roi).unwrap());
-    
-    // Calculate stats
-    let avg_roi = results.iter().map(|r| r.final_roi).sum::<f64>() / results.len() as f64;
-    let best = &results[0];
-    let total_filtered = results.iter().map(|r| r.filtered_trades).sum::<usize>();
-    let positive_count = results.iter().filter(|r| r.final_roi > 0.0).count();
+    // Calculate stats (single pass over results)
+    let (roi_sum, total_filtered, positive_count) = results.iter().fold(
+        (0.0_f64, 0_usize, 0_usize),
+        |(roi_sum, filtered, positive), r| {
+            (roi_sum + r.final_roi, filtered + r.filtered_trades, positive + (r.final_roi > 0.0) as usize)
+        },
+    );
+    let avg_roi = roi_sum / results.len() as f64;
     let win_rate = (positive_count as f64 / results.len() as f64) * 100.0;
     
-    // Best by Sharpe
-    let mut by_sharpe = results.clone();
-    by_sharpe.sort_by(|a, b| b.sharpe_ratio.partial_cmp(&a.sharpe_ratio).unwrap());
-    let best_sharpe = &by_sharpe[0];
-    
-    println!("{}", "=== BEST PERFORMER (ROI) ===".bright_yellow());
-    println!("  Strategy: {}", best.name.bright_green());
-    println!("  ROI: {:.2}%", best.final_roi);
-    println!("  Sharpe: {:.2}", best.sharpe_ratio);
-    println!("  Spacing: {:.2}%", best.grid_spacing);
-    println!("  Levels: {}", best.grid_levels);
-    println!("  Fills: {}", best.total_fills);
-    println!();
-    
-    println!("{}", "=== BEST RISK-ADJUSTED (SHARPE) ===".bright_yellow());
-    println!("  Strategy: {}", best_sharpe.name.bright_cyan());
-    println!("  Sharpe: {:.2}", best_sharpe.sharpe_ratio);
-    println!("  ROI: {:.2}%", best_sharpe.final_roi);
-    println!("  Spacing: {:.2}%", best_sharpe.grid_spacing);
-    println!("  Levels: {}", best_sharpe.grid_levels);
-    println!();
-    
-    println!("{}", "=== OVERALL STATISTICS ===".bright_magenta());
-    println!("  Total Tests: {}", results.len());
-    println!("  Average ROI: {:.2}%", avg_roi);
-    println!("  Win Rate: {:.1}% ({}/{})", win_rate, positive_count, results.len());
-    println!("  Total Filtered: {} trades", total_filtered);
-    println!();
-    
-    println!("{}", "=== RECOMMENDED CONFIG FOR LIVE ===".bright_cyan().bold());
-    println!("  (Based on best risk-adjusted returns)\n");
-    println!("{}", "  [trading]".bright_white());
-    println!("  grid_spacing_percent = {:.2}", best_sharpe.grid_spacing);
-    println!("  grid_levels = {}", best_sharpe.grid_levels);
-    println!("  # Expected ROI: {:.2}%", best_sharpe.final_roi);
-    println!("  # Sharpe Ratio: {:.2}", best_sharpe.sharpe_ratio);
-    println!();
+    // Only the leaders are reported - one linear scan per key instead of a
+    // full sort (plus a cloned copy for the Sharpe ranking)
+    let best = best_by_roi(&results).expect("results is non-empty");
+    let best_sharpe = best_by_sharpe(&results).expect("results is non-empty");
+    
+    // Buffer the whole report behind one stdout lock - one write instead of
+    // a lock + line flush per println!
+    let stdout = io::stdout();
+    let mut out = BufWriter::new(stdout.lock());
+    
+    writeln!(out, "{}", "=== BEST PERFORMER (ROI) ===".bright_yellow())?;
+    writeln!(out, "  Strategy: {}", best.name.bright_green())?;
+    writeln!(out, "  ROI: {:.2}%", best.final_roi)?;
+    writeln!(out, "  Sharpe: {:.2}", best.sharpe_ratio)?;
+    writeln!(out, "  Spacing: {:.2}%", best.grid_spacing)?;
+    writeln!(out, "  Levels: {}", best.grid_levels)?;
+    writeln!(out, "  Fills: {}", best.total_fills)?;
+    writeln!(out)?;
+    
+    writeln!(out, "{}", "=== BEST RISK-ADJUSTED (SHARPE) ===".bright_yellow())?;
+    writeln!(out, "  Strategy: {}", best_sharpe.name.bright_cyan())?;
+    writeln!(out, "  Sharpe: {:.2}", best_sharpe.sharpe_ratio)?;
+    writeln!(out, "  ROI: {:.2}%", best_sharpe.final_roi)?;
+    writeln!(out, "  Spacing: {:.2}%", best_sharpe.grid_spacing)?;
+    writeln!(out, "  Levels: {}", best_sharpe.grid_levels)?;
+    writeln!(out)?;
+    
+    writeln!(out, "{}", "=== OVERALL STATISTICS ===".bright_magenta())?;
+    writeln!(out, "  Total Tests: {}", results.len())?;
+    writeln!(out, "  Average ROI: {:.2}%", avg_roi)?;
+    writeln!(out, "  Win Rate: {:.1}% ({}/{})", win_rate, positive_count, results.len())?;
+    writeln!(out, "  Total Filtered: {} trades", total_filtered)?;
+    writeln!(out)?;
+    
+    writeln!(out, "{}", "=== RECOMMENDED CONFIG FOR LIVE ===".bright_cyan().bold())?;
+    writeln!(out, "  (Based on best risk-adjusted returns)\n")?;
+    writeln!(out, "{}", "  [trading]".bright_white())?;
+    writeln!(out, "  grid_spacing_percent = {:.2}", best_sharpe.grid_spacing)?;
+    writeln!(out, "  grid_levels = {}", best_sharpe.grid_levels)?;
+    writeln!(out, "  # Expected ROI: {:.2}%", best_sharpe.final_roi)?;
+    writeln!(out, "  # Sharpe Ratio: {:.2}", best_sharpe.sharpe_ratio)?;
+    writeln!(out)?;
     
     // Save to file
-    save_analysis(&results, best, best_sharpe, avg_roi, win_rate, total_filtered);
+    if let Ok(filename) = save_analysis(&results, best, best_sharpe, avg_roi, win_rate, total_filtered) {
+        writeln!(out, "Analysis saved to: {}", filename.bright_green())?;
+    }
     
-    println!("{}", "=== ANALYSIS COMPLETE ===".bright_green().bold());
-    println!();
+    writeln!(out, "{}", "=== ANALYSIS COMPLETE ===".bright_green().bold())?;
+    writeln!(out)?;
+    out.flush()
+}
+
+/// Highest-ROI result; ties go to the first one seen (same pick as the
+/// stable descending sort this replaced).
+fn best_by_roi(results: &[TestResult]) -> Option<&TestResult> {
+    results.iter().reduce(|best, r| if r.final_roi > best.final_roi { r } else { best })
+}
+
+/// Highest-Sharpe result; Sharpe ties go to the higher ROI, then to the first
+/// one seen - the order the old ROI sort + stable Sharpe re-sort produced.
+/// This is the config recommended for live, so the tie-break matters. Plain
+/// IEEE comparisons (like best_by_roi and the old partial_cmp sorts), so
+/// -0.0 and 0.0 tie rather than ordering as total_cmp would.
+fn best_by_sharpe(results: &[TestResult]) -> Option<&TestResult> {
+    results.iter().reduce(|best, r| {
+        let better = r.sharpe_ratio > best.sharpe_ratio
+            || (r.sharpe_ratio == best.sharpe_ratio && r.final_roi > best.final_roi);
+        if better { r } else { best }
+    })
 }
 
 fn save_analysis(
@@ -117,42 +164,100 @@ fn save_analysis(
     avg_roi: f64,
     win_rate: f64,
     total_filtered: usize,
-) {
+) -> io::Result<String> {
     use chrono::Local;
     let timestamp = Local::now().format("%Y%m%d_%H%M%S");
     
     let filename = format!("results/optimizer_analysis_{}.txt", timestamp);
     
-    let mut content = String::from("AUTO-OPTIMIZER V2.5 ANALYSIS REPORT\n");
-    content.push_str("===============================================\n\n");
-    content.push_str(&format!("Generated: {}\n", Local::now().format("%Y-%m-%d %H:%M:%S")));
-    content.push_str(&format!("Total Tests: {}\n\n", results.len()));
-    
-    content.push_str("BEST ROI:\n");
-    content.push_str(&format!("  Strategy: {}\n", best_roi.name));
-    content.push_str(&format!("  ROI: {:.2}%\n", best_roi.final_roi));
-    content.push_str(&format!("  Config: {:.2}% spacing, {} levels\n\n", 
-        best_roi.grid_spacing, best_roi.grid_levels));
-    
-    content.push_str("BEST RISK-ADJUSTED (SHARPE):\n");
-    content.push_str(&format!("  Strategy: {}\n", best_sharpe.name));
-    content.push_str(&format!("  Sharpe: {:.2}\n", best_sharpe.sharpe_ratio));
-    content.push_str(&format!("  ROI: {:.2}%\n", best_sharpe.final_roi));
-    content.push_str(&format!("  Config: {:.2}% spacing, {} levels\n\n", 
-        best_sharpe.grid_spacing, best_sharpe.grid_levels));
-    
-    content.push_str("OVERALL STATS:\n");
-    content.push_str(&format!("  Avg ROI: {:.2}%\n", avg_roi));
-    content.push_str(&format!("  Win Rate: {:.1}%\n", win_rate));
-    content.push_str(&format!("  Total Filtered: {}\n\n", total_filtered));
-    
-    content.push_str("RECOMMENDED LIVE CONFIG:\n");
-    content.push_str("[trading]\n");
-    content.push_str(&format!("grid_spacing_percent = {:.2}\n", best_sharpe.grid_spacing));
-    content.push_str(&format!("grid_levels = {}\n", best_sharpe.grid_levels));
-    
-    if let Ok(_) = fs::write(&filename, content) {
-        println!("Analysis saved to: {}", filename.bright_green());
+    // Stream the report through a buffered writer rather than assembling
+    // it from per-line format! temporaries first. Written to a temp file and
+    // renamed into place so nothing ever sees a half-written report.
+    let tmp = format!("{}.tmp", filename);
+    let write_report = || -> io::Result<()> {
+        let mut f = BufWriter::new(File::create(&tmp)?);
+        writeln!(f, "AUTO-OPTIMIZER V2.5 ANALYSIS REPORT")?;
+        writeln!(f, "===============================================\n")?;
+        writeln!(f, "Generated: {}", Local::now().format("%Y-%m-%d %H:%M:%S"))?;
+        writeln!(f, "Total Tests: {}\n", results.len())?;
+        
+        writeln!(f, "BEST ROI:")?;
+        writeln!(f, "  Strategy: {}", best_roi.name)?;
+        writeln!(f, "  ROI: {:.2}%", best_roi.final_roi)?;
+        writeln!(f, "  Config: {:.2}% spacing, {} levels\n", 
+            best_roi.grid_spacing, best_roi.grid_levels)?;
+        
+        writeln!(f, "BEST RISK-ADJUSTED (SHARPE):")?;
+        writeln!(f, "  Strategy: {}", best_sharpe.name)?;
+        writeln!(f, "  Sharpe: {:.2}", best_sharpe.sharpe_ratio)?;
+        writeln!(f, "  ROI: {:.2}%", best_sharpe.final_roi)?;
+        writeln!(f, "  Config: {:.2}% spacing, {} levels\n", 
+            best_sharpe.grid_spacing, best_sharpe.grid_levels)?;
+        
+        writeln!(f, "OVERALL STATS:")?;
+        writeln!(f, "  Avg ROI: {:.2}%", avg_roi)?;
+        writeln!(f, "  Win Rate: {:.1}%", win_rate)?;
+        writeln!(f, "  Total Filtered: {}\n", total_filtered)?;
+        
+        writeln!(f, "RECOMMENDED LIVE CONFIG:")?;
+        writeln!(f, "[trading]")?;
+        writeln!(f, "grid_spacing_percent = {:.2}", best_sharpe.grid_spacing)?;
+        writeln!(f, "grid_levels = {}", best_sharpe.grid_levels)?;
+        
+        f.flush()
+    };
+    
+    // Don't leave a stray .tmp behind if any write or the rename fails
+    if let Err(e) = write_report().and_then(|()| fs::rename(&tmp, &filename)) {
+        let _ = fs::remove_file(&tmp);
+        return Err(e);
     }
+    Ok(filename)
 }
 
+#[cfg(test)]
+mod tests {
+    use super::*;
+    
+    fn result(name: &str, final_roi: f64, sharpe_ratio: f64) -> TestResult {
+        TestResult {
+            name: name.to_string(),
+            final_roi,
+            sharpe_ratio,
+            total_fills: 0,
+            filtered_trades: 0,
+            grid_spacing: 0.2,
+            grid_levels: 10,
+            max_drawdown: 0.0,
+        }
+    }
+    
+    #[test]
+    fn test_best_by_roi_keeps_first_of_ties() {
+        let results = vec![result("a", 5.0, 1.0), result("b", 5.0, 2.0), result("c", 3.0, 3.0)];
+        assert_eq!(best_by_roi(&results).unwrap().name, "a");
+    }
+    
+    #[test]
+    fn test_best_by_sharpe_breaks_ties_on_roi() {
+        let results = vec![result("c", 3.0, 0.0), result("a", 5.0, 0.0), result("b", 4.0, -1.0)];
+        assert_eq!(best_by_sharpe(&results).unwrap().name, "a");
+        
+        let tied = vec![result("x", 5.0, 1.0), result("y", 5.0, 1.0)];
+        assert_eq!(best_by_sharpe(&tied).unwrap().name, "x");
+        
+        // -0.0 == 0.0, so signed zeros tie and the first one seen wins
+        let zero_roi = vec![result("a", -0.0, 1.0), result("b", 0.0, 1.0)];
+        assert_eq!(best_by_sharpe(&zero_roi).unwrap().name, "a");
+        let zero_sharpe = vec![result("a", 0.0, 1.0), result("b", -0.0, 2.0), result("c", 0.0, 2.0)];
+        assert_eq!(best_by_sharpe(&zero_sharpe).unwrap().name, "b");
+        let signed_sharpe = vec![result("a", 5.0, -0.0), result("b", 3.0, 0.0)];
+        assert_eq!(best_by_sharpe(&signed_sharpe).unwrap().name, "a");
+    }
+    
+    #[test]
+    fn test_best_of_empty_is_none() {
+        assert!(best_by_roi(&[]).is_none());
+        assert!(best_by_sharpe(&[]).is_none());
+    }
+}
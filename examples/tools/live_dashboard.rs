@@ -1,8 +1,12 @@
 //! 🎮 Live Interactive CLI Dashboard - Real-Time Trading Monitor
 //! Like htop but for grid trading! Press 'q' to quit, 'r' to refresh.
 
+use std::borrow::Cow;
+use std::ffi::OsStr;
 use std::io::{self, stdout};
-use std::time::{Duration, Instant};
+use std::path::PathBuf;
+use std::thread;
+use std::time::{Duration, Instant, SystemTime};
 use crossterm::{
     event::{self, Event, KeyCode},
     execute,
@@ -16,9 +20,17 @@ use ratatui::{
     widgets::{Block, Borders, Gauge, List, ListItem, Paragraph, Sparkline},
     Terminal,
 };
-use glob::glob;
 use serde::Deserialize;
 
+/// Directory the test suite writes result files into
+const RESULTS_DIR: &str = "results";
+
+/// Rows shown in the results list
+const VISIBLE_ROWS: usize = 20;
+
+/// ROI colour indexed by `roi > 0.0` - [loss, gain]
+const ROI_COLORS: [Color; 2] = [Color::Red, Color::Green];
+
 #[derive(Debug, Deserialize, Clone)]
 struct TestResult {
     name: String,
@@ -30,60 +42,184 @@ struct TestResult {
     grid_levels: u32,
 }
 
+/// Aggregates over the loaded results - computed once per reload rather than
+/// on every frame
+#[derive(Debug, Default, Clone, Copy)]
+struct DashboardStats {
+    avg_roi: f64,
+    win_rate: f64,
+    total_filtered: usize,
+    best_roi: f64,
+}
+
+impl DashboardStats {
+    fn from_results(results: &[TestResult]) -> Self {
+        if results.is_empty() {
+            return Self::default();
+        }
+        
+        // Single pass: every accumulator is updated from the same row
+        let mut roi_sum = 0.0;
+        let mut positive = 0usize;
+        let mut total_filtered = 0usize;
+        let mut best_roi = f64::NEG_INFINITY;
+        for r in results {
+            roi_sum += r.final_roi;
+            positive += (r.final_roi > 0.0) as usize;
+            total_filtered += r.filtered_trades;
+            best_roi = best_roi.max(r.final_roi);
+        }
+        
+        let avg_roi = roi_sum / results.len() as f64;
+        let win_rate = (positive as f64 / results.len() as f64) * 100.0;
+        
+        Self { avg_roi, win_rate, total_filtered, best_roi }
+    }
+}
+
+/// Identity of one results file as of the last load: (path, mtime, size)
+type SourceStamp = (PathBuf, Option<SystemTime>, u64);
+
 struct DashboardState {
     results: Vec<TestResult>,
+    rows: Vec<String>,
+    stats: DashboardStats,
     selected: usize,
     start_time: Instant,
-    roi_history: Vec<f64>,
+    /// Avg ROI per reload, already mapped to sparkline scale
+    roi_sparkline: Vec<u64>,
     last_load_time: Instant,
+    source_stamps: Vec<SourceStamp>,
 }
 
 impl DashboardState {
     fn new() -> Self {
         Self {
             results: Vec::new(),
+            rows: Vec::new(),
+            stats: DashboardStats::default(),
             selected: 0,
             start_time: Instant::now(),
-            roi_history: vec![0.0; 50],
+            roi_sparkline: vec![roi_to_sparkline(0.0); 50],
             last_load_time: Instant::now(),
+            source_stamps: Vec::new(),
         }
     }
     
-    fn load_results(&mut self) {
-        self.results.clear();
+    /// Rescan results/ and reload when any file changed. `force` reloads
+    /// regardless (the 'r' key).
+    fn load_results(&mut self, force: bool) {
+        // Scan results/ directly - a prefix/suffix check per entry is cheaper
+        // than glob's pattern matcher. Stamps use fs::metadata (not
+        // DirEntry::metadata) so symlinked result files track their target.
+        let mut stamps: Vec<SourceStamp> = match std::fs::read_dir(RESULTS_DIR) {
+            Ok(entries) => entries
+                .flatten()
+                .filter(|entry| is_result_file(&entry.file_name()))
+                .map(|entry| {
+                    let path = entry.path();
+                    let meta = std::fs::metadata(&path).ok();
+                    let modified = meta.as_ref().and_then(|m| m.modified().ok());
+                    (path, modified, meta.map_or(0, |m| m.len()))
+                })
+                .collect(),
+            Err(_) => Vec::new(), // No results found yet
+        };
+        // read_dir order is unspecified - sort so stamps compare stably
+        stamps.sort_unstable_by(|a, b| a.0.cmp(&b.0));
         
-        // Safe glob with proper error handling
-        match glob("results/giga_v*_test_*.json") {
-            Ok(paths) => {
-                for entry in paths {
-                    if let Ok(path) = entry {
-                        if let Ok(content) = std::fs::read_to_string(&path) {
-                            if let Ok(data) = serde_json::from_str::<Vec<TestResult>>(&content) {
-                                self.results.extend(data);
-                            }
-                        }
-                    }
-                }
-            }
-            Err(_) => {
-                // No results found yet
-            }
+        // Auto-refresh fires every 2s but result files rarely change that
+        // often - only re-read, re-rank and re-aggregate when one has
+        if force || stamps != self.source_stamps {
+            let paths: Vec<PathBuf> = stamps.iter().map(|(path, _, _)| path.clone()).collect();
+            let loaded = read_result_files(&paths);
+            
+            // Only remember stamps for files that actually loaded - a file
+            // caught mid-write or unreadable stays "changed" and is retried
+            // on the next refresh
+            let mut ok = loaded.iter().map(Option::is_some);
+            stamps.retain(|_| ok.next().unwrap_or(false));
+            self.results = loaded.into_iter().flatten().flatten().collect();
+            
+            let visible = rank_visible(&mut self.results);
+            
+            self.stats = DashboardStats::from_results(&self.results);
+            self.rows = self.results[..visible].iter().map(format_row).collect();
+            
+            self.source_stamps = stamps;
         }
         
-        // Sort by ROI descending
-        self.results.sort_by(|a, b| b.final_roi.partial_cmp(&a.final_roi).unwrap_or(std::cmp::Ordering::Equal));
-        
         // Update ROI history for sparkline
         if !self.results.is_empty() {
-            self.roi_history.rotate_left(1);
-            let avg_roi = self.results.iter().map(|r| r.final_roi).sum::<f64>() / self.results.len() as f64;
-            *self.roi_history.last_mut().unwrap() = avg_roi;
+            self.roi_sparkline.rotate_left(1);
+            *self.roi_sparkline.last_mut().unwrap() = roi_to_sparkline(self.stats.avg_roi);
         }
         
         self.last_load_time = Instant::now();
     }
 }
 
+/// Move the top `VISIBLE_ROWS` results by ROI to the front, sorted descending,
+/// and return how many that is. Only those rows are ever drawn, so they are
+/// partitioned out in O(N) and just that slice is sorted - the rest are left
+/// in unspecified order.
+fn rank_visible(results: &mut [TestResult]) -> usize {
+    let by_roi_desc = |a: &TestResult, b: &TestResult| b.final_roi.total_cmp(&a.final_roi);
+    if results.len() > VISIBLE_ROWS {
+        results.select_nth_unstable_by(VISIBLE_ROWS - 1, by_roi_desc);
+    }
+    let visible = results.len().min(VISIBLE_ROWS);
+    results[..visible].sort_by(by_roi_desc);
+    visible
+}
+
+/// Matches the `giga_v*_test_*.json` result files written by the test suite
+fn is_result_file(name: &OsStr) -> bool {
+    name.to_str()
+        .and_then(|n| n.strip_prefix("giga_v"))
+        .and_then(|n| n.strip_suffix(".json"))
+        .is_some_and(|n| n.contains("_test_"))
+}
+
+/// Read and parse result files on a small pool of scoped threads so file I/O
+/// and JSON decoding overlap across files. Returns one entry per path, in
+/// path order: `None` for a file that could not be read or parsed (or whose
+/// worker panicked), so callers can skip it and retry it later.
+fn read_result_files(paths: &[PathBuf]) -> Vec<Option<Vec<TestResult>>> {
+    if paths.is_empty() {
+        return Vec::new();
+    }
+    
+    let workers = thread::available_parallelism()
+        .map_or(4, |n| n.get())
+        .min(paths.len());
+    let per_worker = paths.len().div_ceil(workers);
+    
+    thread::scope(|s| {
+        let handles: Vec<_> = paths
+            .chunks(per_worker)
+            .map(|chunk| {
+                let handle = s.spawn(move || {
+                    chunk
+                        .iter()
+                        .map(|path| {
+                            // Parse from raw bytes - no intermediate String
+                            let bytes = std::fs::read(path).ok()?;
+                            serde_json::from_slice::<Vec<TestResult>>(&bytes).ok()
+                        })
+                        .collect::<Vec<_>>()
+                });
+                (chunk.len(), handle)
+            })
+            .collect();
+        
+        handles
+            .into_iter()
+            .flat_map(|(len, h)| h.join().unwrap_or_else(|_| vec![None; len]))
+            .collect()
+    })
+}
+
 fn main() -> Result<(), Box<dyn std::error::Error>> {
     // Setup terminal
     enable_raw_mode()?;
@@ -93,7 +229,7 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
     let mut terminal = Terminal::new(backend)?;
     
     let mut state = DashboardState::new();
-    state.load_results();
+    state.load_results(false);
     
     let result = run_app(&mut terminal, &mut state);
     
@@ -113,7 +249,7 @@ fn run_app(terminal: &mut Terminal<CrosstermBackend<io::Stdout>>, state: &mut Da
     loop {
         // Auto-refresh every 2 seconds
         if state.last_load_time.elapsed() > Duration::from_secs(2) {
-            state.load_results();
+            state.load_results(false);
         }
         
         terminal.draw(|f| {
@@ -146,12 +282,12 @@ fn run_app(terminal: &mut Terminal<CrosstermBackend<io::Stdout>>, state: &mut Da
                         }
                     }
                     KeyCode::Down => {
-                        if state.selected < state.results.len().saturating_sub(1) {
+                        if state.selected < state.rows.len().saturating_sub(1) {
                             state.selected += 1;
                         }
                     }
                     KeyCode::Char('r') => {
-                        state.load_results();
+                        state.load_results(true);
                     }
                     _ => {}
                 }
@@ -195,14 +331,10 @@ fn render_stats(f: &mut ratatui::Frame, area: Rect, state: &DashboardState) {
         ])
         .split(area);
     
-    let avg_roi = state.results.iter().map(|r| r.final_roi).sum::<f64>() / state.results.len() as f64;
-    let positive = state.results.iter().filter(|r| r.final_roi > 0.0).count();
-    let win_rate = (positive as f64 / state.results.len() as f64) * 100.0;
-    let total_filtered = state.results.iter().map(|r| r.filtered_trades).sum::<usize>();
-    let best_roi = state.results.first().map(|r| r.final_roi).unwrap_or(0.0);
+    let DashboardStats { avg_roi, win_rate, total_filtered, best_roi } = state.stats;
     
     // Avg ROI Gauge
-    let roi_color = if avg_roi > 0.0 { Color::Green } else { Color::Red };
+    let roi_color = ROI_COLORS[(avg_roi > 0.0) as usize];
     let roi_ratio = (avg_roi.abs() / 10.0).min(1.0);
     let roi_gauge = Gauge::default()
         .block(Block::default().borders(Borders::ALL).title("Avg ROI"))
@@ -233,24 +365,18 @@ fn render_stats(f: &mut ratatui::Frame, area: Rect, state: &DashboardState) {
 }
 
 fn render_results(f: &mut ratatui::Frame, area: Rect, state: &DashboardState) {
-    let items: Vec<ListItem> = state.results.iter().take(20).enumerate().map(|(i, r)| {
-        let color = if r.final_roi > 0.0 { Color::Green } else { Color::Red };
+    // Row text is pre-formatted on load; per frame we only borrow it and
+    // prepend the selection marker
+    let items = state.results.iter().zip(&state.rows).enumerate().map(|(i, (r, row))| {
+        let color = ROI_COLORS[(r.final_roi > 0.0) as usize];
+        let style = Style::default().fg(color);
         let selected = if i == state.selected { "▶ " } else { "  " };
         
-        let line = format!(
-            "{}{:<23} ROI:{:>7.2}% Sharpe:{:>5.2} {:>5.2}%/{:>2}lvl F:{:>3} Filt:{:>3}",
-            selected,
-            truncate(&r.name, 23),
-            r.final_roi,
-            r.sharpe_ratio,
-            r.grid_spacing,
-            r.grid_levels,
-            r.total_fills,
-            r.filtered_trades
-        );
-        
-        ListItem::new(Line::from(Span::styled(line, Style::default().fg(color))))
-    }).collect();
+        ListItem::new(Line::from(vec![
+            Span::styled(selected, style),
+            Span::styled(row.as_str(), style),
+        ]))
+    });
     
     let list = List::new(items)
         .block(Block::default()
@@ -261,25 +387,37 @@ fn render_results(f: &mut ratatui::Frame, area: Rect, state: &DashboardState) {
     f.render_widget(list, area);
 }
 
+fn format_row(r: &TestResult) -> String {
+    format!(
+        "{:<23} ROI:{:>7.2}% Sharpe:{:>5.2} {:>5.2}%/{:>2}lvl F:{:>3} Filt:{:>3}",
+        truncate(&r.name, 23),
+        r.final_roi,
+        r.sharpe_ratio,
+        r.grid_spacing,
+        r.grid_levels,
+        r.total_fills,
+        r.filtered_trades
+    )
+}
+
 fn render_chart(f: &mut ratatui::Frame, area: Rect, state: &DashboardState) {
-    // Convert ROI history to sparkline data (0-100 range)
-    let data: Vec<u64> = state.roi_history.iter()
-        .map(|v| {
-            let normalized = (v + 10.0) * 5.0; // Map -10 to +10 ROI to 0-100 range
-            normalized.max(0.0).min(100.0) as u64
-        })
-        .collect();
-    
     let sparkline = Sparkline::default()
         .block(Block::default()
             .borders(Borders::ALL)
             .title("📈 ROI Trend (last 50 updates)"))
-        .data(&data)
+        .data(&state.roi_sparkline)
         .style(Style::default().fg(Color::Cyan));
     
     f.render_widget(sparkline, area);
 }
 
+/// Convert an ROI sample to sparkline data (0-100 range). Done once when the
+/// sample is recorded instead of re-mapping the whole history every frame.
+fn roi_to_sparkline(roi: f64) -> u64 {
+    let normalized = (roi + 10.0) * 5.0; // Map -10 to +10 ROI to 0-100 range
+    normalized.max(0.0).min(100.0) as u64
+}
+
 fn render_footer(f: &mut ratatui::Frame, area: Rect) {
     let footer_text = "Controls: [q/Esc] Quit | [r] Refresh | [↑↓] Navigate | Auto-refresh: 2s";
     let footer = Paragraph::new(footer_text)
@@ -288,10 +426,153 @@ fn render_footer(f: &mut ratatui::Frame, area: Rect) {
     f.render_widget(footer, area);
 }
 
-fn truncate(s: &str, max_len: usize) -> String {
-    if s.len() > max_len {
-        format!("{}...", &s[..max_len.saturating_sub(3)])
-    } else {
-        format!("{:<width$}", s, width = max_len)
+/// Shorten `s` to at most `max_len` chars, marking the cut with "...".
+/// Borrows when the name already fits - padding is left to the caller's
+/// format spec. Cuts on char boundaries so emoji names can't panic.
+fn truncate(s: &str, max_len: usize) -> Cow<'_, str> {
+    if s.char_indices().nth(max_len).is_none() {
+        return Cow::Borrowed(s);
+    }
+    let cut = s.char_indices()
+        .nth(max_len.saturating_sub(3))
+        .map_or(s.len(), |(i, _)| i);
+    Cow::Owned(format!("{}...", &s[..cut]))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    
+    fn result(name: &str, final_roi: f64, filtered_trades: usize) -> TestResult {
+        TestResult {
+            name: name.to_string(),
+            final_roi,
+            sharpe_ratio: 1.0,
+            total_fills: 0,
+            filtered_trades,
+            grid_spacing: 0.2,
+            grid_levels: 10,
+        }
+    }
+    
+    #[test]
+    fn test_truncate_borrows_when_name_fits() {
+        assert!(matches!(truncate("short", 23), Cow::Borrowed("short")));
+        let exact = "a".repeat(23);
+        assert!(matches!(truncate(&exact, 23), Cow::Borrowed(_)));
+    }
+    
+    #[test]
+    fn test_truncate_cuts_long_names() {
+        assert_eq!(truncate("abcdefghijklmnopqrstuvwx", 23), "abcdefghijklmnopqrst...");
+    }
+    
+    #[test]
+    fn test_truncate_multibyte_names() {
+        // Byte slicing used to panic here: byte 20 falls inside an emoji
+        let name = format!("bot-{}", "🚀".repeat(30));
+        let cut = truncate(&name, 23);
+        assert_eq!(cut.chars().count(), 23);
+        assert_eq!(cut, format!("bot-{}...", "🚀".repeat(16)));
+    }
+    
+    #[test]
+    fn test_rank_visible_orders_top_rows() {
+        // 53 distinct ROIs in shuffled order (17 is coprime with 53)
+        let mut results: Vec<TestResult> = (0..53)
+            .map(|i| {
+                let roi = ((i * 17) % 53) as f64 - 26.0;
+                result(&format!("r{}", i), roi, 0)
+            })
+            .collect();
+        let mut expected: Vec<f64> = results.iter().map(|r| r.final_roi).collect();
+        expected.sort_by(|a, b| b.total_cmp(a));
+        
+        assert_eq!(rank_visible(&mut results), VISIBLE_ROWS);
+        let top: Vec<f64> = results[..VISIBLE_ROWS].iter().map(|r| r.final_roi).collect();
+        assert_eq!(top, expected[..VISIBLE_ROWS]);
+        assert_eq!(results.len(), 53);
+    }
+    
+    #[test]
+    fn test_rank_visible_fewer_than_visible_rows() {
+        let mut results = vec![result("a", 1.0, 0), result("b", 3.0, 0), result("c", -2.0, 0)];
+        assert_eq!(rank_visible(&mut results), 3);
+        let names: Vec<&str> = results.iter().map(|r| r.name.as_str()).collect();
+        assert_eq!(names, ["b", "a", "c"]);
+        assert_eq!(rank_visible(&mut []), 0);
+    }
+    
+    #[test]
+    fn test_read_result_files_keeps_path_order_and_skips_bad_files() {
+        let dir = std::env::temp_dir().join(format!("gridzbotz_dashboard_test_{}", std::process::id()));
+        std::fs::create_dir_all(&dir).unwrap();
+        
+        // Enough files to span several worker chunks; #5 is malformed and
+        // #9 does not exist
+        let paths: Vec<PathBuf> = (0..12)
+            .map(|i| dir.join(format!("giga_v1_test_{:02}.json", i)))
+            .collect();
+        for (i, path) in paths.iter().enumerate() {
+            let body = match i {
+                5 => "[{\"name\": \"truncated\"".to_string(),
+                9 => continue,
+                _ => serde_json::json!([{
+                    "name": format!("r{}", i),
+                    "final_roi": i as f64,
+                    "sharpe_ratio": 1.0,
+                    "total_fills": 0,
+                    "filtered_trades": 0,
+                    "grid_spacing": 0.2,
+                    "grid_levels": 10,
+                }])
+                .to_string(),
+            };
+            std::fs::write(path, body).unwrap();
+        }
+        
+        let loaded = read_result_files(&paths);
+        std::fs::remove_dir_all(&dir).unwrap();
+        
+        assert_eq!(loaded.len(), paths.len());
+        assert!(loaded[5].is_none());
+        assert!(loaded[9].is_none());
+        let names: Vec<String> = loaded.into_iter().flatten().flatten().map(|r| r.name).collect();
+        let expected: Vec<String> = (0..12)
+            .filter(|i| *i != 5 && *i != 9)
+            .map(|i| format!("r{}", i))
+            .collect();
+        assert_eq!(names, expected);
+    }
+    
+    #[test]
+    fn test_is_result_file_matches_glob_pattern() {
+        // Same set as results/giga_v*_test_*.json
+        assert!(is_result_file(OsStr::new("giga_v2_test_20251018.json")));
+        assert!(is_result_file(OsStr::new("giga_v_test_.json")));
+        assert!(!is_result_file(OsStr::new("giga_v2_test.json")));
+        assert!(!is_result_file(OsStr::new("giga_v2_test_1.txt")));
+        assert!(!is_result_file(OsStr::new("old_giga_v2_test_1.json")));
+        assert!(!is_result_file(OsStr::new("optimizer_analysis_20251018.txt.tmp")));
+    }
+    
+    #[test]
+    fn test_stats_empty() {
+        let stats = DashboardStats::from_results(&[]);
+        assert_eq!(stats.avg_roi, 0.0);
+        assert_eq!(stats.win_rate, 0.0);
+        assert_eq!(stats.total_filtered, 0);
+        assert_eq!(stats.best_roi, 0.0);
+    }
+    
+    #[test]
+    fn test_stats_single_pass_values() {
+        // Unsorted on purpose: best_roi must not depend on order
+        let results = vec![result("a", -2.0, 1), result("b", 6.0, 2), result("c", 2.0, 3), result("d", 0.0, 4)];
+        let stats = DashboardStats::from_results(&results);
+        assert!((stats.avg_roi - 1.5).abs() < 1e-12);
+        assert!((stats.win_rate - 50.0).abs() < 1e-12);
+        assert_eq!(stats.total_filtered, 10);
+        assert_eq!(stats.best_roi, 6.0);
     }
 }